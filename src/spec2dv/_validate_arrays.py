@@ -0,0 +1,90 @@
+# src/spec2dv/_validate_arrays.py
+"""
+Array-based validation helpers for very large register maps. Only imported by validate_db
+above its size threshold, so numpy/numba import and JIT costs stay off the common path.
+"""
+from __future__ import annotations
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional: overlap detection stays in plain Python
+    njit = None
+
+from .validate import _MASK_BITS, _find_overlaps
+
+
+def field_flags(
+    reg_widths: Sequence[int], lsbs: Sequence[int], msbs: Sequence[int], resets: Sequence[int]
+) -> Tuple[List[bool], List[bool]]:
+    """Same contract as validate._field_flags, as vectorized NumPy ops."""
+    lsb = np.asarray(lsbs, dtype=np.int64)
+    msb = np.asarray(msbs, dtype=np.int64)
+    reset = np.asarray(resets, dtype=np.int64)
+    fw = msb - lsb + 1
+
+    range_bad = (lsb < 0) | (msb >= np.asarray(reg_widths, dtype=np.int64))
+    # (1 << fw) - 1 overflows int64 from fw=63 on, where any non-negative reset fits
+    max_val = np.left_shift(1, np.clip(fw, 0, 62)) - 1
+    reset_bad = (reset < 0) | ((fw < 63) & (reset > max_val))
+    return range_bad.tolist(), reset_bad.tolist()
+
+
+def _find_overlaps_kernel(reg_ids: np.ndarray, lsbs: np.ndarray, msbs: np.ndarray) -> np.ndarray:
+    """
+    int64-array port of _find_overlaps for Numba: same mask/sweep logic, with the occupancy
+    mask held in a uint64 (a full 64-bit field is special-cased, since shifting by 64 is undefined).
+    """
+    n = lsbs.shape[0]
+    out = np.full(n, -1, dtype=np.int64)
+    all_bits = np.uint64(0xFFFFFFFFFFFFFFFF)
+    occupied = np.uint64(0)
+    prev = -1
+    prev_msb = np.iinfo(np.int64).min
+    for i in range(n):
+        if i == 0 or reg_ids[i] != reg_ids[i - 1]:
+            occupied = np.uint64(0)
+            prev = -1
+            prev_msb = np.iinfo(np.int64).min
+
+        lsb = lsbs[i]
+        msb = msbs[i]
+        lo = max(lsb, 0)
+        hi = min(msb, _MASK_BITS - 1)
+        mask = np.uint64(0)
+        if hi >= lo:
+            if hi - lo + 1 == _MASK_BITS:
+                mask = all_bits
+            else:
+                mask = ((np.uint64(1) << np.uint64(hi - lo + 1)) - np.uint64(1)) << np.uint64(lo)
+
+        if lsb >= 0 and msb < _MASK_BITS:
+            overlaps = (occupied & mask) != np.uint64(0)
+        else:
+            overlaps = lsb <= prev_msb
+        occupied |= mask
+        if overlaps:
+            out[i] = prev
+        if msb > prev_msb:
+            prev = i
+            prev_msb = msb
+    return out
+
+
+if njit is not None:
+    # cache=True persists the compiled kernel in __pycache__, so only the first run pays for JIT.
+    _find_overlaps_kernel = njit(cache=True)(_find_overlaps_kernel)
+
+
+def find_overlaps(reg_ids: Sequence[int], lsbs: Sequence[int], msbs: Sequence[int]) -> List[int]:
+    """Same contract as validate._find_overlaps, compiled with Numba when it is installed."""
+    if njit is None:
+        return _find_overlaps(reg_ids, lsbs, msbs)
+    return _find_overlaps_kernel(
+        np.asarray(reg_ids, dtype=np.int64),
+        np.asarray(lsbs, dtype=np.int64),
+        np.asarray(msbs, dtype=np.int64),
+    ).tolist()
@@ -37,10 +37,14 @@ def ingest(
     variant: Optional[Path] = typer.Option(None, help="Variant overlay YAML path."),
     db: Path = typer.Option(Path("spec2dv.sqlite"), help="SQLite DB file path."),
     git_commit: Optional[str] = typer.Option(None, help="Git commit hash for traceability."),
+    cache_dir: Optional[Path] = typer.Option(
+        None,
+        help="Opt-in parsed-spec cache directory. Hits skip re-validation and entries are never evicted.",
+    ),
 ):
     """Parse YAML spec (+ optional variant overlay) and write to DB."""
     init_db(db)
-    bundle = load_spec_bundle(spec_path=spec, variant_path=variant)
+    bundle = load_spec_bundle(spec_path=spec, variant_path=variant, cache_dir=cache_dir)
     with connect_db(db) as conn:
         upsert_spec_bundle(conn, bundle)
         write_spec_version(conn, bundle.spec_version, bundle.variant_name, git_commit)
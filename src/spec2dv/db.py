@@ -1,17 +1,18 @@
 # src/spec2dv/db.py
 from __future__ import annotations
 
+import hashlib
 import json
 import sqlite3
 from contextlib import contextmanager
+from itertools import groupby
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
 from .models import SpecBundle
 
 SCHEMA_SQL = """
-PRAGMA foreign_keys = ON;
-
 CREATE TABLE IF NOT EXISTS spec_version (
   id INTEGER PRIMARY KEY AUTOINCREMENT,
   version TEXT NOT NULL,
@@ -67,15 +68,42 @@ CREATE TABLE IF NOT EXISTS constraint_def (
   applies_to TEXT NOT NULL,
   match_json TEXT NOT NULL,
   rule TEXT NOT NULL,
-  severity TEXT NOT NULL
+  severity TEXT NOT NULL,
+  hash BLOB
 );
 """
 
+# Hot-path statements, hoisted so every call reuses the same text (and statement cache entry).
+_SELECT_BLOCK_SQL = "SELECT id FROM ip_block WHERE name=? AND ifnull(variant,'')=ifnull(?, '')"
+_UPDATE_BLOCK_SQL = "UPDATE ip_block SET base_addr=? WHERE id=?"
+_INSERT_BLOCK_SQL = "INSERT INTO ip_block(name, base_addr, variant) VALUES(?,?,?)"
+_DELETE_BLOCK_REGS_SQL = "DELETE FROM reg WHERE block_id=?"
+_INSERT_REG_SQL = "INSERT INTO reg(id, block_id, name, offset, width) VALUES(?,?,?,?,?)"
+_INSERT_FIELD_SQL = "INSERT INTO field(id, reg_id, name, lsb, msb, access, reset) VALUES(?,?,?,?,?,?,?)"
+_INSERT_ENUM_SQL = "INSERT INTO enum_value(field_id, name, value) VALUES(?,?,?)"
+_INSERT_CONSTRAINT_SQL = (
+    "INSERT OR IGNORE INTO constraint_def(name, applies_to, match_json, rule, severity, hash) VALUES(?,?,?,?,?,?)"
+)
+_INSERT_SPEC_VERSION_SQL = "INSERT INTO spec_version(version, variant, git_commit) VALUES(?,?,?)"
+
+# Child-table indexes rebuilt after each bulk write instead of being maintained per row.
+BULK_INDEX_SQL = {
+    "ux_reg_block_offset": "CREATE UNIQUE INDEX IF NOT EXISTS ux_reg_block_offset ON reg(block_id, offset)",
+    "ux_field_reg_name": "CREATE UNIQUE INDEX IF NOT EXISTS ux_field_reg_name ON field(reg_id, name)",
+    "ux_enum_field_value": "CREATE UNIQUE INDEX IF NOT EXISTS ux_enum_field_value ON enum_value(field_id, value)",
+}
+
 
 @contextmanager
 def connect_db(db_path: Path) -> Iterator[sqlite3.Connection]:
-    conn = sqlite3.connect(str(db_path))
+    conn = sqlite3.connect(str(db_path), cached_statements=512)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys=ON")
+    # WAL + NORMAL sync: commits append to the log instead of fsyncing the main DB file.
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-65536")
     try:
         yield conn
         conn.commit()
@@ -83,73 +111,154 @@ def connect_db(db_path: Path) -> Iterator[sqlite3.Connection]:
         conn.close()
 
 
+@contextmanager
+def tuple_rows(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Temporarily fetch plain tuples instead of sqlite3.Row for hot-path queries."""
+    prev = conn.row_factory
+    conn.row_factory = None
+    try:
+        yield conn
+    finally:
+        conn.row_factory = prev
+
+
 def init_db(db_path: Path) -> None:
     db_path.parent.mkdir(parents=True, exist_ok=True)
     with connect_db(db_path) as conn:
         conn.executescript(SCHEMA_SQL)
+        # DBs created before constraint hashing lack the column; CREATE TABLE IF NOT EXISTS won't add it.
+        cols = {row["name"] for row in conn.execute("PRAGMA table_info(constraint_def)")}
+        if "hash" not in cols:
+            conn.execute("ALTER TABLE constraint_def ADD COLUMN hash BLOB")
+        conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_constraint_hash ON constraint_def(hash)")
+
+
+def group_by_parent(rows: Iterable[Sequence]) -> Dict[int, List[Sequence]]:
+    """Group rows whose first column is a parent id (and are ordered by it) into {parent_id: rows}."""
+    return {parent_id: list(grp) for parent_id, grp in groupby(rows, key=itemgetter(0))}
+
+
+def sql_hex(col: str) -> str:
+    """SQL expression formatting an integer column like Python's hex(), including the sign
+    (printf('%x') alone renders negatives as 64-bit two's complement). INT64_MIN gets its own
+    arm because negating it overflows to a REAL."""
+    return (
+        f"CASE WHEN {col} = -9223372036854775808 THEN '-0x8000000000000000' "
+        f"WHEN {col} < 0 THEN '-' || printf('0x%x', -{col}) "
+        f"ELSE printf('0x%x', {col}) END"
+    )
+
+
+class ChildGroups:
+    """
+    Walk a child cursor in lockstep with its parent rows. Children carry their parent id in the
+    first column and must be ordered the same way the parents are visited, so only one parent's
+    children are held in memory at a time.
+    """
+
+    def __init__(self, rows: Iterable[Sequence]) -> None:
+        self._groups = groupby(rows, key=itemgetter(0))
+        self._head = next(self._groups, None)
+
+    def take(self, parent_id: int) -> List[Sequence]:
+        if self._head is None or self._head[0] != parent_id:
+            return []
+        children = list(self._head[1])
+        self._head = next(self._groups, None)
+        return children
 
 
 def _get_or_create_block(conn: sqlite3.Connection, name: str, base_addr: int, variant: Optional[str]) -> int:
-    row = conn.execute(
-        "SELECT id FROM ip_block WHERE name=? AND ifnull(variant,'')=ifnull(?, '')",
-        (name, variant),
-    ).fetchone()
+    row = conn.execute(_SELECT_BLOCK_SQL, (name, variant)).fetchone()
     if row:
         # update base addr in case spec changed
-        conn.execute("UPDATE ip_block SET base_addr=? WHERE id=?", (base_addr, row["id"]))
+        conn.execute(_UPDATE_BLOCK_SQL, (base_addr, row["id"]))
         return int(row["id"])
 
-    cur = conn.execute(
-        "INSERT INTO ip_block(name, base_addr, variant) VALUES(?,?,?)",
-        (name, base_addr, variant),
-    )
+    cur = conn.execute(_INSERT_BLOCK_SQL, (name, base_addr, variant))
     return int(cur.lastrowid)
 
 
+def _last_id(conn: sqlite3.Connection, table: str) -> int:
+    # AUTOINCREMENT tables track their high-water mark in sqlite_sequence; starting
+    # above it keeps pre-assigned ids from ever reusing a deleted row's id.
+    row = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM sqlite_sequence WHERE name=?", (table,)).fetchone()
+    return int(row[0])
+
+
 def upsert_spec_bundle(conn: sqlite3.Connection, bundle: SpecBundle) -> None:
     # For MVP: write blocks/registers/fields exactly as provided
     # In real flows you might key by spec_version and keep historical copies.
     variant = bundle.variant_name
     doc = bundle.doc
 
+    # One write transaction for the whole bundle; connect_db commits it on exit.
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+
+    # Pydantic already parsed every numeric attribute as int, so values go in as-is.
+    # Ids are assigned up front so child rows can reference their parents
+    # without a lastrowid round-trip, letting every table go in one executemany.
+    reg_id = _last_id(conn, "reg")
+    field_id = _last_id(conn, "field")
+    reg_rows = []
+    field_rows = []
+    enum_rows = []
+
     for blk in doc.ip_blocks:
         block_id = _get_or_create_block(conn, blk.name, blk.base_addr, variant)
 
         # Remove existing regs under this block to avoid partial updates for MVP
-        conn.execute("DELETE FROM reg WHERE block_id=?", (block_id,))
-
-        for r in blk.registers:
-            reg_cur = conn.execute(
-                "INSERT INTO reg(block_id, name, offset, width) VALUES(?,?,?,?)",
-                (block_id, r.name, int(r.offset), int(r.width)),
-            )
-            reg_id = int(reg_cur.lastrowid)
-
-            for f in r.fields:
-                field_cur = conn.execute(
-                    "INSERT INTO field(reg_id, name, lsb, msb, access, reset) VALUES(?,?,?,?,?,?)",
-                    (reg_id, f.name, int(f.lsb), int(f.msb), f.access, int(f.reset)),
-                )
-                field_id = int(field_cur.lastrowid)
+        conn.execute(_DELETE_BLOCK_REGS_SQL, (block_id,))
+
+        # Insert in semantic order (offset / lsb / value) so ids follow it and
+        # exports can ORDER BY id instead of re-sorting.
+        for r in sorted(blk.registers, key=attrgetter("offset")):
+            reg_id += 1
+            reg_rows.append((reg_id, block_id, r.name, r.offset, r.width))
+
+            for f in sorted(r.fields, key=attrgetter("lsb")):
+                field_id += 1
+                field_rows.append((field_id, reg_id, f.name, f.lsb, f.msb, f.access, f.reset))
 
                 if f.enum:
-                    for ev in f.enum:
-                        conn.execute(
-                            "INSERT INTO enum_value(field_id, name, value) VALUES(?,?,?)",
-                            (field_id, ev.name, int(ev.value)),
-                        )
-
-    # Constraints
-    conn.execute("DELETE FROM constraint_def")
+                    enum_rows.extend((field_id, ev.name, ev.value) for ev in sorted(f.enum, key=attrgetter("value")))
+
+    # Drop only after the deletes above, which use these indexes for the cascade.
+    for name in BULK_INDEX_SQL:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+    conn.executemany(_INSERT_REG_SQL, reg_rows)
+    conn.executemany(_INSERT_FIELD_SQL, field_rows)
+    conn.executemany(_INSERT_ENUM_SQL, enum_rows)
+
+    for sql in BULK_INDEX_SQL.values():
+        conn.execute(sql)
+
+    # Constraints are content-addressed: rows whose hash is unchanged are left alone,
+    # stale ones are deleted and only new ones inserted.
+    constraint_rows = []
+    # Many constraints share the same match dict (e.g. {"access": "RW"}); serialize each shape once.
+    match_json: Dict[frozenset, str] = {}
     for c in doc.constraints:
-        conn.execute(
-            "INSERT INTO constraint_def(name, applies_to, match_json, rule, severity) VALUES(?,?,?,?,?)",
-            (c.name, c.applies_to, json.dumps(c.match, sort_keys=True), c.rule, c.severity),
-        )
+        try:
+            # type(v) keeps 1 / True / 1.0 apart, since they hash alike but serialize differently
+            key = frozenset((k, type(v), v) for k, v in c.match.items())
+        except TypeError:  # nested lists/dicts are unhashable: serialize directly
+            mj = json.dumps(c.match, sort_keys=True)
+        else:
+            mj = match_json.get(key)
+            if mj is None:
+                mj = match_json[key] = json.dumps(c.match, sort_keys=True)
+        canonical = json.dumps([c.name, c.applies_to, mj, c.rule, c.severity]).encode("utf-8")
+        h = hashlib.blake2b(canonical, digest_size=16).digest()
+        constraint_rows.append((c.name, c.applies_to, mj, c.rule, c.severity, h))
+
+    wanted = {row[-1] for row in constraint_rows}
+    stale = [(row["id"],) for row in conn.execute("SELECT id, hash FROM constraint_def") if row["hash"] not in wanted]
+    conn.executemany("DELETE FROM constraint_def WHERE id=?", stale)
+    conn.executemany(_INSERT_CONSTRAINT_SQL, constraint_rows)
 
 
 def write_spec_version(conn: sqlite3.Connection, version: str, variant: Optional[str], git_commit: Optional[str]) -> None:
-    conn.execute(
-        "INSERT INTO spec_version(version, variant, git_commit) VALUES(?,?,?)",
-        (version, variant, git_commit),
-    )
\ No newline at end of file
+    conn.execute(_INSERT_SPEC_VERSION_SQL, (version, variant, git_commit))
\ No newline at end of file
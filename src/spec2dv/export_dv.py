@@ -5,6 +5,8 @@ import json
 from pathlib import Path
 import sqlite3
 
+from .db import group_by_parent, sql_hex
+
 
 def export_dv_constraints_json(conn: sqlite3.Connection, out_path: Path) -> None:
     """
@@ -22,7 +24,10 @@ def export_dv_constraints_json(conn: sqlite3.Connection, out_path: Path) -> None
         JOIN ip_block b ON b.id=r.block_id
         ORDER BY b.name, r.name, f.name
         """
-    ).fetchall()
+    )
+    enums_by_field = group_by_parent(
+        conn.execute("SELECT field_id, name, value FROM enum_value ORDER BY field_id, id")
+    )
 
     for row in rows:
         key = f"{row['block_name']}.{row['reg_name']}.{row['field_name']}"
@@ -30,10 +35,7 @@ def export_dv_constraints_json(conn: sqlite3.Connection, out_path: Path) -> None
             out["fields"][key] = {"reserved": True}
             continue
 
-        enums = conn.execute(
-            "SELECT name, value FROM enum_value WHERE field_id=? ORDER BY value",
-            (row["field_id"],),
-        ).fetchall()
+        enums = enums_by_field.get(row["field_id"])
         if enums:
             out["fields"][key] = {"legal_enum": [{"name": e["name"], "value": e["value"]} for e in enums]}
 
@@ -57,24 +59,23 @@ def export_uvm_regmodel(conn: sqlite3.Connection, out_path: Path) -> None:
     lines.append("")
 
     blocks = conn.execute("SELECT id, name FROM ip_block ORDER BY name").fetchall()
+    regs_by_block = group_by_parent(
+        conn.execute(
+            f"SELECT block_id, id, name, {sql_hex('offset')} AS offset_hex, width FROM reg ORDER BY block_id, id"
+        )
+    )
+    fields_by_reg = group_by_parent(
+        conn.execute("SELECT reg_id, name, lsb, msb, access, reset FROM field ORDER BY reg_id, id")
+    )
 
     for b in blocks:
-        regs = conn.execute(
-            "SELECT id, name, offset, width FROM reg WHERE block_id=? ORDER BY offset",
-            (b["id"],),
-        ).fetchall()
-
-        for r in regs:
+        for r in regs_by_block.get(b["id"], ()):
             cls = f"{b['name']}_{r['name']}".lower()
-            lines.append(f"// {b['name']}.{r['name']} @ offset {hex(r['offset'])}")
+            lines.append(f"// {b['name']}.{r['name']} @ offset {r['offset_hex']}")
             lines.append(f"class {cls}; // extends uvm_reg")
             lines.append("  // uvm_reg_field fields[$];")
             lines.append("  function void build();")
-            fields = conn.execute(
-                "SELECT name, lsb, msb, access, reset FROM field WHERE reg_id=? ORDER BY lsb",
-                (r["id"],),
-            ).fetchall()
-            for f in fields:
+            for f in fields_by_reg.get(r["id"], ()):
                 width = (f["msb"] - f["lsb"]) + 1
                 lines.append(
                     f"    // {f['name']} [{f['msb']}:{f['lsb']}] access={f['access']} reset={f['reset']} width={width}"
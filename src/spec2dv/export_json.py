@@ -5,43 +5,63 @@ import json
 from pathlib import Path
 import sqlite3
 
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
+
+from .db import ChildGroups, tuple_rows
+
 
 def export_registers_json(conn: sqlite3.Connection, out_path: Path) -> None:
-    blocks = conn.execute("SELECT id, name, base_addr, variant FROM ip_block ORDER BY name").fetchall()
+    # Every query walks blocks in the same order so children stream alongside their parents.
+    with tuple_rows(conn):
+        blocks = conn.execute(
+            "SELECT b.id, b.name, b.base_addr, b.variant FROM ip_block b ORDER BY b.name, ifnull(b.variant,'')"
+        )
+        regs = ChildGroups(conn.execute(
+            """
+            SELECT r.block_id, r.id, r.name, r.offset, r.width
+            FROM reg r JOIN ip_block b ON b.id=r.block_id
+            ORDER BY b.name, ifnull(b.variant,''), r.id
+            """
+        ))
+        fields = ChildGroups(conn.execute(
+            """
+            SELECT f.reg_id, f.id, f.name, f.lsb, f.msb, f.access, f.reset
+            FROM field f JOIN reg r ON r.id=f.reg_id JOIN ip_block b ON b.id=r.block_id
+            ORDER BY b.name, ifnull(b.variant,''), r.id, f.id
+            """
+        ))
+        enums = ChildGroups(conn.execute(
+            """
+            SELECT e.field_id, e.name, e.value
+            FROM enum_value e JOIN field f ON f.id=e.field_id
+            JOIN reg r ON r.id=f.reg_id JOIN ip_block b ON b.id=r.block_id
+            ORDER BY b.name, ifnull(b.variant,''), r.id, f.id, e.id
+            """
+        ))
     out = {"ip_blocks": []}
 
-    for b in blocks:
-        regs = conn.execute(
-            "SELECT id, name, offset, width FROM reg WHERE block_id=? ORDER BY offset",
-            (b["id"],),
-        ).fetchall()
-
+    for block_id, block_name, base_addr, variant in blocks:
         blk_obj = {
-            "name": b["name"],
-            "base_addr": b["base_addr"],
-            "variant": b["variant"],
+            "name": block_name,
+            "base_addr": base_addr,
+            "variant": variant,
             "registers": [],
         }
 
-        for r in regs:
-            fields = conn.execute(
-                "SELECT id, name, lsb, msb, access, reset FROM field WHERE reg_id=? ORDER BY lsb",
-                (r["id"],),
-            ).fetchall()
-
-            reg_obj = {"name": r["name"], "offset": r["offset"], "width": r["width"], "fields": []}
-            for f in fields:
-                enums = conn.execute(
-                    "SELECT name, value FROM enum_value WHERE field_id=? ORDER BY value",
-                    (f["id"],),
-                ).fetchall()
+        for _, reg_id, reg_name, offset, width in regs.take(block_id):
+            reg_obj = {"name": reg_name, "offset": offset, "width": width, "fields": []}
+            for _, field_id, field_name, lsb, msb, access, reset in fields.take(reg_id):
+                field_enums = enums.take(field_id)
                 field_obj = {
-                    "name": f["name"],
-                    "lsb": f["lsb"],
-                    "msb": f["msb"],
-                    "access": f["access"],
-                    "reset": f["reset"],
-                    "enum": [{"name": e["name"], "value": e["value"]} for e in enums] if enums else None,
+                    "name": field_name,
+                    "lsb": lsb,
+                    "msb": msb,
+                    "access": access,
+                    "reset": reset,
+                    "enum": [{"name": name, "value": value} for _, name, value in field_enums] if field_enums else None,
                 }
                 reg_obj["fields"].append(field_obj)
 
@@ -49,4 +69,7 @@ def export_registers_json(conn: sqlite3.Connection, out_path: Path) -> None:
 
         out["ip_blocks"].append(blk_obj)
 
-    out_path.write_text(json.dumps(out, indent=2), encoding="utf-8")
\ No newline at end of file
+    if orjson is not None:
+        out_path.write_bytes(orjson.dumps(out, option=orjson.OPT_INDENT_2))
+    else:
+        out_path.write_text(json.dumps(out, indent=2), encoding="utf-8")
@@ -1,56 +1,112 @@
 # src/spec2dv/export_xml.py
 from __future__ import annotations
 
+from itertools import chain
 from pathlib import Path
 import sqlite3
-import xml.etree.ElementTree as ET
+from typing import Iterable, Tuple
+from xml.sax.saxutils import escape
+
+from .db import ChildGroups, sql_hex, tuple_rows
+
+# Same attribute escaping as xml.etree.ElementTree, so output is byte-identical to tree.write().
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#09;"}
+
+
+def _start_tag(tag: str, attrs: Iterable[Tuple[str, str]]) -> str:
+    """Open tag without its closing '>' / ' />' so callers can decide on children."""
+    return "<" + tag + "".join(f' {k}="{escape(v, _ATTR_ENTITIES)}"' for k, v in attrs)
 
 
 def export_registers_xml(conn: sqlite3.Connection, out_path: Path) -> None:
-    root = ET.Element("spec")
-
-    for b in conn.execute("SELECT id, name, base_addr, variant FROM ip_block ORDER BY name").fetchall():
-        b_el = ET.SubElement(root, "ip_block", {
-            "name": b["name"],
-            "base_addr": hex(b["base_addr"]),
-            "variant": b["variant"] or "",
-        })
-
-        regs = conn.execute(
-            "SELECT id, name, offset, width FROM reg WHERE block_id=? ORDER BY offset",
-            (b["id"],),
-        ).fetchall()
-
-        for r in regs:
-            r_el = ET.SubElement(b_el, "register", {
-                "name": r["name"],
-                "offset": hex(r["offset"]),
-                "width": str(r["width"]),
-            })
-
-            fields = conn.execute(
-                "SELECT id, name, lsb, msb, access, reset FROM field WHERE reg_id=? ORDER BY lsb",
-                (r["id"],),
-            ).fetchall()
-
-            for f in fields:
-                f_el = ET.SubElement(r_el, "field", {
-                    "name": f["name"],
-                    "lsb": str(f["lsb"]),
-                    "msb": str(f["msb"]),
-                    "access": f["access"],
-                    "reset": str(f["reset"]),
-                })
-
-                enums = conn.execute(
-                    "SELECT name, value FROM enum_value WHERE field_id=? ORDER BY value",
-                    (f["id"],),
-                ).fetchall()
-                if enums:
-                    e_el = ET.SubElement(f_el, "enum")
-                    for ev in enums:
-                        ET.SubElement(e_el, "value", {"name": ev["name"], "value": str(ev["value"])})
-
-    tree = ET.ElementTree(root)
+    """Stream registers.xml straight to disk instead of building an ElementTree first."""
+    # Every query walks blocks in the same order so children stream alongside their parents.
+    # Attribute values come back already formatted as text, so the writer only concatenates.
+    with tuple_rows(conn):
+        blocks = conn.execute(
+            f"""
+            SELECT b.id, b.name, {sql_hex('b.base_addr')}, ifnull(b.variant,'')
+            FROM ip_block b ORDER BY b.name, ifnull(b.variant,'')
+            """
+        )
+        regs = ChildGroups(conn.execute(
+            f"""
+            SELECT r.block_id, r.id, r.name, {sql_hex('r.offset')}, CAST(r.width AS TEXT)
+            FROM reg r JOIN ip_block b ON b.id=r.block_id
+            ORDER BY b.name, ifnull(b.variant,''), r.id
+            """
+        ))
+        fields = ChildGroups(conn.execute(
+            """
+            SELECT f.reg_id, f.id, f.name, CAST(f.lsb AS TEXT), CAST(f.msb AS TEXT), f.access,
+                   CAST(f.reset AS TEXT)
+            FROM field f JOIN reg r ON r.id=f.reg_id JOIN ip_block b ON b.id=r.block_id
+            ORDER BY b.name, ifnull(b.variant,''), r.id, f.id
+            """
+        ))
+        enums = ChildGroups(conn.execute(
+            """
+            SELECT e.field_id, e.name, CAST(e.value AS TEXT)
+            FROM enum_value e JOIN field f ON f.id=e.field_id
+            JOIN reg r ON r.id=f.reg_id JOIN ip_block b ON b.id=r.block_id
+            ORDER BY b.name, ifnull(b.variant,''), r.id, f.id, e.id
+            """
+        ))
+
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    tree.write(out_path, encoding="utf-8", xml_declaration=True)
\ No newline at end of file
+    with out_path.open("w", encoding="utf-8") as fh:
+        write = fh.write
+        write("<?xml version='1.0' encoding='utf-8'?>\n")
+        first = blocks.fetchone()
+        if first is None:
+            write("<spec />")
+            return
+
+        write("<spec>")
+        for block_id, block_name, base_hex, variant in chain((first,), blocks):
+            write(_start_tag("ip_block", (
+                ("name", block_name),
+                ("base_addr", base_hex),
+                ("variant", variant),
+            )))
+            block_regs = regs.take(block_id)
+            if not block_regs:
+                write(" />")
+                continue
+            write(">")
+
+            for _, reg_id, reg_name, offset_hex, width in block_regs:
+                write(_start_tag("register", (
+                    ("name", reg_name),
+                    ("offset", offset_hex),
+                    ("width", width),
+                )))
+                reg_fields = fields.take(reg_id)
+                if not reg_fields:
+                    write(" />")
+                    continue
+                write(">")
+
+                for _, field_id, field_name, lsb, msb, access, reset in reg_fields:
+                    # Hot path: only name/access can need escaping, so skip the generic helper.
+                    write("".join((
+                        '<field name="', escape(field_name, _ATTR_ENTITIES),
+                        '" lsb="', lsb,
+                        '" msb="', msb,
+                        '" access="', escape(access, _ATTR_ENTITIES),
+                        '" reset="', reset, '"',
+                    )))
+                    field_enums = enums.take(field_id)
+                    if not field_enums:
+                        write(" />")
+                        continue
+
+                    write("><enum>")
+                    for _, name, value in field_enums:
+                        write(_start_tag("value", (("name", name), ("value", value))))
+                        write(" />")
+                    write("</enum></field>")
+
+                write("</register>")
+            write("</ip_block>")
+        write("</spec>")
@@ -1,16 +1,26 @@
 # src/spec2dv/ingest.py
 from __future__ import annotations
 
+import hashlib
+import json
 from pathlib import Path
 from typing import Optional, Any, Dict
 
 import yaml
 
-from .models import SpecBundle, SpecDoc
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml-backed C parser
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
 
+from .models import SpecBundle, SpecDoc, SpecRecord
 
-def _load_yaml(path: Path) -> Dict[str, Any]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
+# Bump when the SpecDoc models change shape so stale cache entries are ignored.
+_SPEC_CACHE_VERSION = b"1"
+
+
+def _parse_yaml(raw: bytes, path: Path) -> Dict[str, Any]:
+    data = yaml.load(raw.decode("utf-8"), Loader=_SafeLoader)
     if not isinstance(data, dict):
         raise ValueError(f"YAML root must be a mapping: {path}")
     return data
@@ -26,22 +36,62 @@ def _merge_variant(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, A
     return base  # no structural merge for MVP
 
 
-def load_spec_bundle(spec_path: Path, variant_path: Optional[Path]) -> SpecBundle:
-    base_raw = _load_yaml(spec_path)
+def _read_cached_doc(cache_path: Path) -> Optional[SpecRecord]:
+    try:
+        return SpecRecord.from_dict(json.loads(cache_path.read_bytes()))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # miss (or unreadable entry): caller does a full parse
+
+
+def _write_cached_doc(cache_path: Path, data: Dict[str, Any]) -> None:
+    # Best effort: a spec that cannot round-trip through JSON simply isn't cached.
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(cache_path)
+    except (OSError, TypeError):
+        pass
+
+
+def load_spec_bundle(
+    spec_path: Path,
+    variant_path: Optional[Path],
+    cache_dir: Optional[Path] = None,
+) -> SpecBundle:
+    """
+    Parse + validate the spec, reusing a previous result from cache_dir when the inputs are
+    unchanged. Cache entries are keyed by the sha256 of the spec and variant YAML bytes, so a
+    hit skips both parsing the base spec and Pydantic validation.
+    """
+    raw = spec_path.read_bytes()
+    variant_raw = variant_path.read_bytes() if variant_path else None
+
+    cache_path = None
+    doc = None
+    if cache_dir is not None:
+        h = hashlib.sha256(_SPEC_CACHE_VERSION + b"\0" + raw)
+        if variant_raw is not None:
+            h.update(b"\0" + variant_raw)
+        cache_path = cache_dir / f"{h.hexdigest()}.json"
+        doc = _read_cached_doc(cache_path)
 
-    variant_name = None
-    variant_overrides: Dict[str, Any] = {}
-    if variant_path:
-        overlay_raw = _load_yaml(variant_path)
-        variant_name = overlay_raw.get("variant")
-        variant_overrides = overlay_raw.get("overrides", {}) or {}
+    overlay_raw = _parse_yaml(variant_raw, variant_path) if variant_raw is not None else {}
+    variant_name = overlay_raw.get("variant")
+    variant_overrides: Dict[str, Any] = overlay_raw.get("overrides", {}) or {}
 
-    merged_raw = _merge_variant(base_raw, {"variant": variant_name, "overrides": variant_overrides})
-    doc = SpecDoc.model_validate(merged_raw)
+    if doc is None:
+        base_raw = _parse_yaml(raw, spec_path)
+        merged_raw = _merge_variant(base_raw, {"variant": variant_name, "overrides": variant_overrides})
+        # Pydantic validates once here; everything downstream works on slotted records.
+        data = SpecDoc.model_validate(merged_raw).model_dump()
+        if cache_path is not None:
+            _write_cached_doc(cache_path, data)
+        doc = SpecRecord.from_dict(data)
 
     return SpecBundle(
         spec_version=doc.spec_version,
         variant_name=variant_name,
         doc=doc,
         variant_overrides=variant_overrides,
-    )
\ No newline at end of file
+    )
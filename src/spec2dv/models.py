@@ -1,7 +1,8 @@
 # src/spec2dv/models.py
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -62,9 +63,98 @@ class SpecDoc(BaseModel):
     constraints: List[ConstraintDef] = Field(default_factory=list)
 
 
-class SpecBundle(BaseModel):
+# Post-validation records. Pydantic only runs at the YAML boundary; ingest converts the
+# result once into these slotted, frozen dataclasses, so the DB writer gets plain
+# attribute access without per-object validation state.
+
+@dataclass(slots=True, frozen=True)
+class EnumRecord:
+    name: str
+    value: int
+
+
+@dataclass(slots=True, frozen=True)
+class FieldRecord:
+    name: str
+    lsb: int
+    msb: int
+    access: str
+    reset: int
+    enum: Optional[Tuple[EnumRecord, ...]]
+
+
+@dataclass(slots=True, frozen=True)
+class RegisterRecord:
+    name: str
+    offset: int
+    width: int
+    fields: Tuple[FieldRecord, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class IPBlockRecord:
+    name: str
+    base_addr: int
+    registers: Tuple[RegisterRecord, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class ConstraintRecord:
+    name: str
+    applies_to: str
+    match: Dict[str, Any]
+    rule: str
+    severity: str
+
+
+@dataclass(slots=True, frozen=True)
+class SpecRecord:
+    spec_version: str
+    ip_blocks: Tuple[IPBlockRecord, ...]
+    constraints: Tuple[ConstraintRecord, ...]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SpecRecord:
+        """Build from a SpecDoc.model_dump() dict; the data is trusted, nothing is re-validated."""
+        return cls(
+            spec_version=data["spec_version"],
+            ip_blocks=tuple(
+                IPBlockRecord(
+                    b["name"],
+                    b["base_addr"],
+                    tuple(
+                        RegisterRecord(
+                            r["name"],
+                            r["offset"],
+                            r["width"],
+                            tuple(
+                                FieldRecord(
+                                    f["name"],
+                                    f["lsb"],
+                                    f["msb"],
+                                    f["access"],
+                                    f["reset"],
+                                    None if f["enum"] is None else tuple(EnumRecord(e["name"], e["value"]) for e in f["enum"]),
+                                )
+                                for f in r["fields"]
+                            ),
+                        )
+                        for r in b["registers"]
+                    ),
+                )
+                for b in data["ip_blocks"]
+            ),
+            constraints=tuple(
+                ConstraintRecord(c["name"], c["applies_to"], c["match"], c["rule"], c["severity"])
+                for c in data["constraints"]
+            ),
+        )
+
+
+@dataclass(slots=True)
+class SpecBundle:
     """Merged base spec + variant overlay metadata."""
     spec_version: str
     variant_name: Optional[str]
-    doc: SpecDoc
-    variant_overrides: Dict[str, Any] = Field(default_factory=dict)
\ No newline at end of file
+    doc: SpecRecord
+    variant_overrides: Dict[str, Any] = field(default_factory=dict)
@@ -2,9 +2,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Sequence, Tuple
 import sqlite3
 
+from .db import tuple_rows
+
 
 @dataclass
 class ValidationIssue:
@@ -40,80 +42,137 @@ class ValidationResult:
         return "\n".join(lines)
 
 
+# Overlaps among fields in the low 64 bits are checked as bitmasks (covers 32/64-bit registers).
+_MASK_BITS = 64
+
+# Fields above which validate_db switches to the numpy/numba helpers. Fetching rows and building
+# issues dominate, and importing numpy+numba costs ~0.3 s, so the array kernels only catch up in
+# the millions. Measured on clean specs with a warm Numba cache (scalar vs array): 2.0 s vs 2.2 s
+# at 640k fields, 9.4 s vs 9.8 s at 2.56M, 19.5 s vs 19.3-20.5 s at 5.12M.
+_ARRAY_MIN_FIELDS = 5_000_000
+
+
 def _field_width(lsb: int, msb: int) -> int:
     return (msb - lsb) + 1
 
 
+def _clipped_mask(lsb: int, msb: int) -> int:
+    """Bits [msb:lsb] restricted to the low _MASK_BITS bits."""
+    lo, hi = max(lsb, 0), min(msb, _MASK_BITS - 1)
+    return ((1 << (hi - lo + 1)) - 1) << lo if hi >= lo else 0
+
+
+def _field_flags(
+    reg_widths: Sequence[int], lsbs: Sequence[int], msbs: Sequence[int], resets: Sequence[int]
+) -> Tuple[List[bool], List[bool]]:
+    """Per field: (bits outside the register width, reset value too wide)."""
+    # within reg width
+    range_bad = [lsb < 0 or msb >= w for w, lsb, msb in zip(reg_widths, lsbs, msbs)]
+    # reset fits
+    reset_bad = [
+        reset < 0 or reset > (1 << _field_width(lsb, msb)) - 1
+        for lsb, msb, reset in zip(lsbs, msbs, resets)
+    ]
+    return range_bad, reset_bad
+
+
+def _find_overlaps(reg_ids: Sequence[int], lsbs: Sequence[int], msbs: Sequence[int]) -> List[int]:
+    """
+    For fields sorted by (register, lsb), return per field the index of an earlier field in the
+    same register that it overlaps, or -1.
+
+    Fields inside the low 64 bits overlap iff their mask meets the bits already claimed. Fields
+    reaching past that fall back to a sweep: with fields sorted by lsb, one overlaps iff it starts
+    at or below the highest msb seen so far (and that field is the one it overlaps).
+    """
+    out = [-1] * len(lsbs)
+    cur_reg = None
+    occupied, prev, prev_msb = 0, -1, float("-inf")
+    for i, (reg_id, lsb, msb) in enumerate(zip(reg_ids, lsbs, msbs)):
+        if reg_id != cur_reg:
+            cur_reg = reg_id
+            occupied, prev, prev_msb = 0, -1, float("-inf")
+
+        if 0 <= lsb and msb < _MASK_BITS:
+            mask = ((1 << (msb - lsb + 1)) - 1) << lsb
+            overlaps = occupied & mask
+        else:
+            mask = _clipped_mask(lsb, msb)
+            overlaps = lsb <= prev_msb
+        occupied |= mask
+        if overlaps:
+            out[i] = prev
+        if msb > prev_msb:
+            prev, prev_msb = i, msb
+    return out
+
+
+def _array_helpers():
+    """The numpy/numba helpers module, or None without numpy (it ships in the `fast` extra)."""
+    try:
+        from . import _validate_arrays
+    except ImportError:
+        return None
+    return _validate_arrays
+
+
 def validate_db(conn: sqlite3.Connection) -> ValidationResult:
     res = ValidationResult()
 
-    # Check: field ranges and resets
-    rows = conn.execute(
-        """
-        SELECT b.name AS block_name, r.name AS reg_name, r.width AS reg_width,
-               f.name AS field_name, f.lsb, f.msb, f.reset
-        FROM field f
-        JOIN reg r ON r.id=f.reg_id
-        JOIN ip_block b ON b.id=r.block_id
-        ORDER BY b.name, r.name, f.lsb
-        """
-    ).fetchall()
-
-    for row in rows:
-        blk = row["block_name"]
-        reg = row["reg_name"]
-        fw = _field_width(row["lsb"], row["msb"])
-
-        # within reg width
-        if row["lsb"] < 0 or row["msb"] >= row["reg_width"]:
+    with tuple_rows(conn):
+        rows = conn.execute(
+            """
+            SELECT r.id, b.name, r.name, r.width, f.name, f.lsb, f.msb, f.reset
+            FROM field f
+            JOIN reg r ON r.id=f.reg_id
+            JOIN ip_block b ON b.id=r.block_id
+            ORDER BY b.name, r.name, r.id, f.lsb, f.id
+            """
+        ).fetchall()
+    if not rows:
+        return res
+
+    reg_ids, blks, regs, reg_widths, names, lsbs, msbs, resets = zip(*rows)
+    # Imported lazily: numpy and numba would add ~0.3 s to every CLI command that loads them.
+    arrays = _array_helpers() if len(rows) > _ARRAY_MIN_FIELDS else None
+    if arrays is not None:
+        range_bad, reset_bad = arrays.field_flags(reg_widths, lsbs, msbs, resets)
+        overlap_with = arrays.find_overlaps(reg_ids, lsbs, msbs)
+    else:
+        range_bad, reset_bad = _field_flags(reg_widths, lsbs, msbs, resets)
+        overlap_with = _find_overlaps(reg_ids, lsbs, msbs)
+
+    for i, (blk, reg, field_name, f_lsb, f_msb) in enumerate(zip(blks, regs, names, lsbs, msbs)):
+        if range_bad[i]:
             res.issues.append(
                 ValidationIssue(
                     "ERROR",
                     "FIELD_RANGE",
-                    f"{blk}.{reg}.{row['field_name']}",
-                    f"Field bits [{row['msb']}:{row['lsb']}] outside register width {row['reg_width']}",
+                    f"{blk}.{reg}.{field_name}",
+                    f"Field bits [{f_msb}:{f_lsb}] outside register width {reg_widths[i]}",
                 )
             )
 
-        # reset fits
-        max_val = (1 << fw) - 1
-        if row["reset"] < 0 or row["reset"] > max_val:
+        if reset_bad[i]:
+            width = _field_width(f_lsb, f_msb)
             res.issues.append(
                 ValidationIssue(
                     "ERROR",
                     "RESET_WIDTH",
-                    f"{blk}.{reg}.{row['field_name']}",
-                    f"Reset {row['reset']} does not fit width {fw} (max {max_val})",
+                    f"{blk}.{reg}.{field_name}",
+                    f"Reset {resets[i]} does not fit width {width} (max {(1 << width) - 1})",
                 )
             )
 
-    # Check: overlap inside each register
-    regs = conn.execute(
-        """
-        SELECT r.id, b.name AS block_name, r.name AS reg_name, r.width
-        FROM reg r JOIN ip_block b ON b.id=r.block_id
-        """
-    ).fetchall()
-
-    for rr in regs:
-        fields = conn.execute(
-            "SELECT name, lsb, msb FROM field WHERE reg_id=? ORDER BY lsb",
-            (rr["id"],),
-        ).fetchall()
+        j = overlap_with[i]
+        if j >= 0:
+            res.issues.append(
+                ValidationIssue(
+                    "ERROR",
+                    "FIELD_OVERLAP",
+                    f"{blk}.{reg}",
+                    f"Field {field_name} [{f_msb}:{f_lsb}] overlaps {names[j]} [{msbs[j]}:{lsbs[j]}]",
+                )
+            )
 
-        occupied = []
-        for f in fields:
-            # check overlap vs occupied ranges
-            for (ol, om, oname) in occupied:
-                if not (f["msb"] < ol or f["lsb"] > om):
-                    res.issues.append(
-                        ValidationIssue(
-                            "ERROR",
-                            "FIELD_OVERLAP",
-                            f"{rr['block_name']}.{rr['reg_name']}",
-                            f"Field {f['name']} [{f['msb']}:{f['lsb']}] overlaps {oname} [{om}:{ol}]",
-                        )
-                    )
-            occupied.append((f["lsb"], f["msb"], f["name"]))
-
-    return res
\ No newline at end of file
+    return res
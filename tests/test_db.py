@@ -0,0 +1,16 @@
+# tests/test_db.py
+import sqlite3
+
+import pytest
+
+from spec2dv.db import sql_hex
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+@pytest.mark.parametrize("value", [INT64_MIN, INT64_MIN + 1, -16, -1, 0, 1, 255, 0x4000_0000, INT64_MAX])
+def test_sql_hex_matches_python_hex(value):
+    conn = sqlite3.connect(":memory:")
+    (text,) = conn.execute(f"SELECT {sql_hex('v')} FROM (SELECT ? AS v)", (value,)).fetchone()
+    assert text == hex(value)
@@ -0,0 +1,72 @@
+# tests/test_export_xml.py
+import xml.etree.ElementTree as ET
+
+from spec2dv.db import connect_db, init_db
+from spec2dv.export_xml import export_registers_xml
+
+INT64_MIN = -(2**63)
+INT64_MAX = 2**63 - 1
+
+
+def _reference_xml(conn, out_path):
+    """The ElementTree exporter the streaming writer replaced; its output is the contract."""
+    root = ET.Element("spec")
+    for b in conn.execute("SELECT id, name, base_addr, variant FROM ip_block ORDER BY name, ifnull(variant,'')"):
+        b_el = ET.SubElement(root, "ip_block", {
+            "name": b["name"],
+            "base_addr": hex(b["base_addr"]),
+            "variant": b["variant"] or "",
+        })
+        for r in conn.execute("SELECT id, name, offset, width FROM reg WHERE block_id=? ORDER BY id", (b["id"],)):
+            r_el = ET.SubElement(b_el, "register", {
+                "name": r["name"],
+                "offset": hex(r["offset"]),
+                "width": str(r["width"]),
+            })
+            for f in conn.execute(
+                "SELECT id, name, lsb, msb, access, reset FROM field WHERE reg_id=? ORDER BY id", (r["id"],)
+            ):
+                f_el = ET.SubElement(r_el, "field", {
+                    "name": f["name"],
+                    "lsb": str(f["lsb"]),
+                    "msb": str(f["msb"]),
+                    "access": f["access"],
+                    "reset": str(f["reset"]),
+                })
+                enums = conn.execute(
+                    "SELECT name, value FROM enum_value WHERE field_id=? ORDER BY id", (f["id"],)
+                ).fetchall()
+                if enums:
+                    e_el = ET.SubElement(f_el, "enum")
+                    for ev in enums:
+                        ET.SubElement(e_el, "value", {"name": ev["name"], "value": str(ev["value"])})
+    ET.ElementTree(root).write(out_path, encoding="utf-8", xml_declaration=True)
+
+
+def test_streamed_xml_matches_elementtree(tmp_path):
+    db_path = tmp_path / "spec.sqlite"
+    init_db(db_path)
+    with connect_db(db_path) as conn:
+        blocks = [("UART", 0x4000_0000, None), ("NEG", -16, "client_b"), ("MIN", INT64_MIN, None), ("EMPTY", 0, "v")]
+        for name, base, variant in blocks:
+            conn.execute("INSERT INTO ip_block(name, base_addr, variant) VALUES (?,?,?)", (name, base, variant))
+        regs = [
+            (1, "CTRL", 0x0, 32), (1, "STATUS", 0x4, 32), (1, "WIDE", 0x8, 64),
+            (2, "LOW", INT64_MIN + 1, 32), (2, "DOWN", -4, 32), (2, "ZERO", 0, 32), (2, "UP", 255, 32),
+            (3, "MIN", INT64_MIN, 32), (3, "MAX", INT64_MAX, 32),
+        ]
+        conn.executemany("INSERT INTO reg(block_id, name, offset, width) VALUES (?,?,?,?)", regs)
+        fields = [
+            (1, "EN", 0, 0, "RW", 1), (1, 'MODE"<&>', 1, 3, "R\tW", 5), (2, "BUSY", 0, 0, "RO", 0),
+            (3, "ALL", 0, 63, "RW", INT64_MAX), (4, "NEG", -2, 3, "RW", -1), (8, "F", 0, 31, "RW", 0),
+        ]
+        conn.executemany("INSERT INTO field(reg_id, name, lsb, msb, access, reset) VALUES (?,?,?,?,?,?)", fields)
+        enums = [(2, "IDLE", 0), (2, "RUN\n", 1), (2, "NEG", -3), (4, "X", 7)]
+        conn.executemany("INSERT INTO enum_value(field_id, name, value) VALUES (?,?,?)", enums)
+
+        export_registers_xml(conn, tmp_path / "streamed.xml")
+        _reference_xml(conn, tmp_path / "reference.xml")
+
+    streamed = (tmp_path / "streamed.xml").read_bytes()
+    assert b'base_addr="-0x8000000000000000"' in streamed
+    assert streamed == (tmp_path / "reference.xml").read_bytes()
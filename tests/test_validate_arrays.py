@@ -0,0 +1,90 @@
+# tests/test_validate_arrays.py
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from spec2dv import _validate_arrays as arrays
+from spec2dv.validate import _field_flags, _find_overlaps
+
+# The kernel's edge handling (uint64 masks, a full 64-bit field, the sweep past bit 63) is a
+# hand port of _find_overlaps, so check it both as plain Python over arrays and compiled.
+_KERNELS = {"python": getattr(arrays._find_overlaps_kernel, "py_func", arrays._find_overlaps_kernel)}
+if arrays.njit is not None:
+    _KERNELS["numba"] = arrays._find_overlaps_kernel
+
+
+def _as_arrays(*cols):
+    return [np.asarray(c, dtype=np.int64) for c in cols]
+
+
+def _check_overlaps(reg_ids, lsbs, msbs):
+    expected = _find_overlaps(reg_ids, lsbs, msbs)
+    assert arrays.find_overlaps(reg_ids, lsbs, msbs) == expected
+    for kernel in _KERNELS.values():
+        assert kernel(*_as_arrays(reg_ids, lsbs, msbs)).tolist() == expected
+
+
+def _check_flags(reg_widths, lsbs, msbs, resets):
+    assert arrays.field_flags(reg_widths, lsbs, msbs, resets) == _field_flags(reg_widths, lsbs, msbs, resets)
+
+
+def _random_fields(rng, n_regs):
+    """Fields sorted by (register, lsb) like validate_db's query, with widths up to 128 bits."""
+    rows = []
+    for reg_id in range(n_regs):
+        width = rng.choice((8, 16, 32, 64, 128))
+        for _ in range(rng.randint(1, 12)):
+            lsb = rng.randint(-4, width + 4)
+            msb = lsb + rng.choice((0, 0, 1, 3, 7, rng.randint(0, 70)))
+            fw = msb - lsb + 1
+            reset = rng.choice((0, 1, -1, (1 << min(fw, 63)) - 1, 1 << min(fw, 62), rng.randint(0, 2**63 - 1)))
+            rows.append((reg_id, lsb, width, msb, reset))
+    rows.sort(key=lambda r: (r[0], r[1]))
+    return [list(col) for col in zip(*rows)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_registers_match_scalar(seed):
+    reg_ids, lsbs, widths, msbs, resets = _random_fields(random.Random(seed), n_regs=150)
+    _check_overlaps(reg_ids, lsbs, msbs)
+    _check_flags(widths, lsbs, msbs, resets)
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        [(0, 63)],  # full 64-bit field
+        [(0, 63), (0, 0)],
+        [(0, 31), (32, 63), (63, 63)],
+        [(60, 70)],  # msb >= 64
+        [(0, 63), (64, 127)],
+        [(62, 63), (63, 80), (100, 130)],
+        [(64, 70), (65, 66)],
+        [(-3, 2)],  # negative lsb
+        [(-3, 2), (0, 0)],
+        [(-8, -4), (-2, 1), (1, 1)],
+    ],
+)
+def test_edge_overlaps_match_scalar(fields):
+    lsbs, msbs = (list(col) for col in zip(*sorted(fields)))
+    _check_overlaps([1] * len(lsbs), lsbs, msbs)
+
+
+@pytest.mark.parametrize(
+    "lsb, msb, reset",
+    [
+        (0, 63, 2**63 - 1),  # fw = 64: any non-negative reset fits
+        (0, 63, -1),
+        (1, 63, 2**63 - 1),  # fw = 63: max is exactly INT64_MAX
+        (1, 63, 2**62),
+        (0, 62, 2**63 - 1),
+        (0, 61, 2**62),  # fw = 62: one past max
+        (0, 61, 2**62 - 1),
+        (-3, 2, 63),
+        (70, 80, 2047),
+    ],
+)
+def test_edge_flags_match_scalar(lsb, msb, reset):
+    _check_flags([64], [lsb], [msb], [reset])